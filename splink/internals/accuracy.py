@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import TYPE_CHECKING, Optional
 
 from splink.internals.block_from_labels import block_from_labels
@@ -496,7 +495,10 @@ def _predict_from_label_column_sql(linker, label_colname):
     # In the case of labels, we use them to block
     # In the case we have a label column, we want to apply the model's blocking rules
     # but add in blocking on the label colname
-    linker = deepcopy(linker)
+    # A structural settings copy is sufficient isolation here - we only mutate
+    # the blocking rules on the clone - and is much cheaper than deepcopying
+    # the linker
+    linker = linker._clone_with_settings(linker._settings_obj.copy())
     settings = linker._settings_obj
     brs = settings._blocking_rules_to_generate_predictions
 
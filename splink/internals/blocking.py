@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, List, Literal, Optional
 
 from sqlglot import parse_one
@@ -182,12 +183,15 @@ class BlockingRule:
             br, dialect=self.sqlglot_dialect
         )  # using sqlglot==11.4.1
 
-    @property
+    @cached_property
     def _equi_join_conditions(self):
         """
         Extract the equi join conditions from the blocking rule as a tuple:
         source_keys, join_keys
 
+        Cached because parsing the rule through sqlglot is relatively
+        expensive and blocking_rule_sql never changes after construction
+
         Returns:
             list of tuples like [(name, name), (substr(name,1,2), substr(name,2,3))]
         """
@@ -216,12 +220,16 @@ class BlockingRule:
 
         return keys_strings
 
-    @property
+    @cached_property
     def _filter_conditions(self):
         # A more accurate term might be "non-equi-join conditions"
         # or "complex join conditions", but to capture the idea these are
         # filters that have to be applied post-creation of the pairwise record
         # comparison i've opted to call it a filter
+        # Cached for the same reason as _equi_join_conditions.  Note each
+        # property parses the rule afresh via _parsed_join_condition:
+        # _equi_join_conditions mutates the tree it extracts keys from, so
+        # the parse itself cannot safely be shared between the two
         j = self._parsed_join_condition
         _, _, filter_condition = join_condition(j)
         if not filter_condition:
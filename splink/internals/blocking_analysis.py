@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import sqlglot
 
@@ -22,7 +23,7 @@ from splink.internals.charts import (
 )
 from splink.internals.database_api import AcceptableInputTableType, DatabaseAPISubClass
 from splink.internals.input_column import InputColumn
-from splink.internals.misc import calculate_cartesian, ensure_is_iterable
+from splink.internals.misc import ensure_is_iterable
 from splink.internals.pipeline import CTEPipeline
 from splink.internals.splink_dataframe import SplinkDataFrame
 from splink.internals.vertically_concatenate import (
@@ -85,31 +86,25 @@ def _number_of_comparisons_generated_by_blocking_rule_post_filters_sqls(
     return sqls
 
 
-def _count_comparisons_from_blocking_rule_pre_filter_conditions_sqls(
+def _input_tablenames_and_concat_sqls(
     input_data_dict: dict[str, "SplinkDataFrame"],
-    blocking_rule: "BlockingRule",
-    link_type: str,
-    db_api: DatabaseAPISubClass,
-) -> list[dict[str, str]]:
+    two_dataset_link_only: bool,
+) -> Tuple[str, str, list[dict[str, str]]]:
     input_dataframes = list(input_data_dict.values())
 
-    join_conditions = blocking_rule._equi_join_conditions
-    two_dataset_link_only = link_type == "link_only" and len(input_dataframes) == 2
-
-    sqls = []
-
     if two_dataset_link_only:
-        input_tablename_l = input_dataframes[0].physical_name
-        input_tablename_r = input_dataframes[1].physical_name
-    else:
-        sql = vertically_concatenate_sql(
-            input_data_dict, salting_required=False, source_dataset_input_column=None
-        )
-        sqls.append({"sql": sql, "output_table_name": "__splink__df_concat"})
+        return input_dataframes[0].physical_name, input_dataframes[1].physical_name, []
+
+    sql = vertically_concatenate_sql(
+        input_data_dict, salting_required=False, source_dataset_input_column=None
+    )
+    sqls = [{"sql": sql, "output_table_name": "__splink__df_concat"}]
+    return "__splink__df_concat", "__splink__df_concat", sqls
 
-        input_tablename_l = "__splink__df_concat"
-        input_tablename_r = "__splink__df_concat"
 
+def _join_key_select_expressions(
+    join_conditions: list[Tuple[str, str]],
+) -> Tuple[str, str, str, str, str]:
     l_cols_sel = []
     r_cols_sel = []
     l_cols_gb = []
@@ -125,102 +120,89 @@ def _count_comparisons_from_blocking_rule_pre_filter_conditions_sqls(
         r_cols_gb.append(r_key)
         using.append(f"key_{i}")
 
-    l_cols_sel_str = ", ".join(l_cols_sel)
-    r_cols_sel_str = ", ".join(r_cols_sel)
-    l_cols_gb_str = ", ".join(l_cols_gb)
-    r_cols_gb_str = ", ".join(r_cols_gb)
-    using_str = ", ".join(using)
+    return (
+        ", ".join(l_cols_sel),
+        ", ".join(r_cols_sel),
+        ", ".join(l_cols_gb),
+        ", ".join(r_cols_gb),
+        ", ".join(using),
+    )
+
+
+def _count_comparisons_from_blocking_rule_pre_filter_conditions_sqls(
+    input_data_dict: dict[str, "SplinkDataFrame"],
+    blocking_rule: "BlockingRule",
+    link_type: str,
+    db_api: DatabaseAPISubClass,
+) -> list[dict[str, str]]:
+    input_dataframes = list(input_data_dict.values())
+
+    join_conditions = blocking_rule._equi_join_conditions
+    two_dataset_link_only = link_type == "link_only" and len(input_dataframes) == 2
 
     if not join_conditions:
+        # No equi-join conditions means the pre-filter count is just the
+        # product of input row counts, so count the physical tables directly
+        # rather than building the vertically concatenated table
         if two_dataset_link_only:
+            input_tablename_l = input_dataframes[0].physical_name
+            input_tablename_r = input_dataframes[1].physical_name
             sql = f"""
             SELECT
-                (SELECT COUNT(*) FROM {input_tablename_l}) as count_l,
-                (SELECT COUNT(*) FROM {input_tablename_r}) as count_r,
-                (SELECT COUNT(*) FROM {input_tablename_l})
-                *
-                (SELECT COUNT(*) FROM {input_tablename_r}) as block_count
-
+                CAST(
+                    (SELECT COUNT(*) FROM {input_tablename_l})
+                    *
+                    (SELECT COUNT(*) FROM {input_tablename_r})
+                AS BIGINT) as count_of_pairwise_comparisons_generated
             """
         else:
-            sql = """
-            select
-                count(*) as count_l,
-                count(*) as count_r,
-                count(*) * count(*) as block_count
-            from __splink__df_concat
+            counts_unioned = " union all ".join(
+                f"select count(*) as c from {df.physical_name}"
+                for df in input_dataframes
+            )
+            sql = f"""
+            select cast(sum(c) * sum(c) as bigint)
+                as count_of_pairwise_comparisons_generated
+            from ({counts_unioned}) as input_counts
             """
-        sqls.append({"sql": sql, "output_table_name": "__splink__block_counts"})
-        return sqls
+        return [{"sql": sql, "output_table_name": "__splink__total_of_block_counts"}]
 
-    sql = f"""
-    select {l_cols_sel_str}, count(*) as count_l
-    from {input_tablename_l}
-    group by {l_cols_gb_str}
-    """
-
-    sqls.append(
-        {"sql": sql, "output_table_name": "__splink__count_comparisons_from_blocking_l"}
-    )
-
-    sql = f"""
-    select {r_cols_sel_str}, count(*) as count_r
-    from {input_tablename_r}
-    group by {r_cols_gb_str}
-    """
-
-    sqls.append(
-        {"sql": sql, "output_table_name": "__splink__count_comparisons_from_blocking_r"}
+    input_tablename_l, input_tablename_r, sqls = _input_tablenames_and_concat_sqls(
+        input_data_dict, two_dataset_link_only
     )
 
+    (
+        l_cols_sel_str,
+        r_cols_sel_str,
+        l_cols_gb_str,
+        r_cols_gb_str,
+        using_str,
+    ) = _join_key_select_expressions(join_conditions)
+
+    # A single aggregate over the joined per-key counts.  Emitting this as
+    # one statement (rather than materialising the per-key join product)
+    # lets the engine keep the whole computation in a single hash aggregate
     sql = f"""
-    select *, count_l, count_r, count_l * count_r as block_count
-    from __splink__count_comparisons_from_blocking_l
-    inner join __splink__count_comparisons_from_blocking_r
+    select cast(sum(l.count_l * r.count_r) as bigint)
+        as count_of_pairwise_comparisons_generated
+    from (
+        select {l_cols_sel_str}, count(*) as count_l
+        from {input_tablename_l}
+        group by {l_cols_gb_str}
+    ) as l
+    inner join (
+        select {r_cols_sel_str}, count(*) as count_r
+        from {input_tablename_r}
+        group by {r_cols_gb_str}
+    ) as r
     using ({using_str})
     """
 
-    sqls.append({"sql": sql, "output_table_name": "__splink__block_counts"})
+    sqls.append({"sql": sql, "output_table_name": "__splink__total_of_block_counts"})
 
     return sqls
 
 
-def _row_counts_per_input_table(
-    *,
-    splink_df_dict: dict[str, "SplinkDataFrame"],
-    link_type: backend_link_type_options,
-    source_dataset_input_column: Optional[InputColumn],
-    db_api: DatabaseAPISubClass,
-) -> "SplinkDataFrame":
-    pipeline = CTEPipeline()
-
-    sql = vertically_concatenate_sql(
-        splink_df_dict,
-        salting_required=False,
-        source_dataset_input_column=source_dataset_input_column,
-    )
-    pipeline.enqueue_sql(sql, "__splink__df_concat")
-
-    if link_type == "dedupe_only":
-        sql = """
-        select count(*) as count
-        from __splink__df_concat
-        """
-    elif source_dataset_input_column is not None:
-        sql = f"""
-        select count(*) as count
-        from __splink__df_concat
-        group by {source_dataset_input_column.name}
-        """
-    else:
-        raise ValueError(
-            "If you are using link_only or link_and_dedupe, you must provide a "
-            "source_dataset_column_name"
-        )
-    pipeline.enqueue_sql(sql, "__splink__df_count")
-    return db_api.sql_pipeline_to_splink_dataframe(pipeline)
-
-
 def _process_unique_id_columns(
     unique_id_column_name: str,
     source_dataset_column_name: Optional[str],
@@ -276,6 +258,55 @@ def _process_unique_id_columns(
         )
 
 
+def _pre_filter_comparison_counts_for_rules(
+    *,
+    splink_df_dict: dict[str, "SplinkDataFrame"],
+    blocking_rules: List[BlockingRule],
+    link_type: backend_link_type_options,
+    db_api: DatabaseAPISubClass,
+) -> list[int]:
+    """Pre-filter comparison counts for a batch of blocking rules, computed
+    in a single pipeline execution rather than one round-trip per rule
+    """
+    if not blocking_rules:
+        return []
+
+    pipeline = CTEPipeline()
+    concat_enqueued = False
+
+    for i, br in enumerate(blocking_rules):
+        sqls = _count_comparisons_from_blocking_rule_pre_filter_conditions_sqls(
+            splink_df_dict, br, link_type, db_api
+        )
+        for sql_info in sqls:
+            if sql_info["output_table_name"] == "__splink__df_concat":
+                # the concatenated input is shared across all the rules
+                if not concat_enqueued:
+                    pipeline.enqueue_sql(sql_info["sql"], "__splink__df_concat")
+                    concat_enqueued = True
+            else:
+                pipeline.enqueue_sql(
+                    sql_info["sql"], f"__splink__total_of_block_counts_{i}"
+                )
+
+    sql = " union all ".join(
+        f"""
+        select {i} as rule_index, count_of_pairwise_comparisons_generated
+        from __splink__total_of_block_counts_{i}
+        """
+        for i in range(len(blocking_rules))
+    )
+    pipeline.enqueue_sql(sql, "__splink__total_of_block_counts_all")
+
+    result = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+    counts = [0] * len(blocking_rules)
+    for record in result.as_record_dict():
+        count = record["count_of_pairwise_comparisons_generated"]
+        # a rule whose join keys match nothing sums over zero rows, i.e. null
+        counts[int(record["rule_index"])] = 0 if count is None else count
+    return counts
+
+
 def _cumulative_comparisons_to_be_scored_from_blocking_rules(
     *,
     splink_df_dict: dict[str, "SplinkDataFrame"],
@@ -286,24 +317,28 @@ def _cumulative_comparisons_to_be_scored_from_blocking_rules(
     unique_id_input_column: InputColumn,
     source_dataset_input_column: Optional[InputColumn],
 ) -> pd.DataFrame:
-    # Check none of the blocking rules will create a vast/computationally
-    # intractable number of comparisons
-    for br in blocking_rules:
-        # TODO: Deal properly with exlpoding rules
-        count = _count_comparisons_generated_from_blocking_rule(
-            splink_df_dict=splink_df_dict,
-            blocking_rule=br,
-            link_type=link_type,
-            db_api=db_api,
-            max_rows_limit=max_rows_limit,
-            compute_post_filter_count=False,
-            unique_id_input_column=unique_id_input_column,
-            source_dataset_input_column=source_dataset_input_column,
+    if not blocking_rules:
+        return pd.DataFrame(
+            columns=[
+                "blocking_rule",
+                "row_count",
+                "cumulative_rows",
+                "cartesian",
+                "match_key",
+                "start",
+            ]
         )
-        count_pre_filter = count[
-            "number_of_comparisons_generated_pre_filter_conditions"
-        ]
 
+    # Check none of the blocking rules will create a vast/computationally
+    # intractable number of comparisons
+    # TODO: Deal properly with exlpoding rules
+    pre_filter_counts = _pre_filter_comparison_counts_for_rules(
+        splink_df_dict=splink_df_dict,
+        blocking_rules=blocking_rules,
+        link_type=link_type,
+        db_api=db_api,
+    )
+    for br, count_pre_filter in zip(blocking_rules, pre_filter_counts):
         if float(count_pre_filter) > max_rows_limit:
             # TODO: Use a SplinkException?  Want this to give a sensible message
             # when ocoming from estimate_probability_two_random_records_match
@@ -314,15 +349,6 @@ def _cumulative_comparisons_to_be_scored_from_blocking_rules(
                 "blocking rule or increase the max_rows_limit."
             )
 
-    rc = _row_counts_per_input_table(
-        splink_df_dict=splink_df_dict,
-        link_type=link_type,
-        source_dataset_input_column=source_dataset_input_column,
-        db_api=db_api,
-    ).as_record_dict()
-
-    cartesian_count = calculate_cartesian(rc, link_type)
-
     for n, br in enumerate(blocking_rules):
         br.add_preceding_rules(blocking_rules[:n])
 
@@ -377,56 +403,74 @@ def _cumulative_comparisons_to_be_scored_from_blocking_rules(
 
     pipeline.enqueue_list_of_sqls(sqls)
 
+    # Compute the cartesian count in the same pipeline so the engine only
+    # scans __splink__df_concat once, rather than issuing a separate
+    # count query and combining the results in Python
+    if link_type in ("link_only", "two_dataset_link_only"):
+        if source_dataset_column_name is None:
+            raise ValueError(
+                "A source dataset column is required to count comparisons "
+                "for link_only jobs"
+            )
+        sql = f"""
+        select (sum(c) * sum(c) - sum(c * c)) / 2 as cartesian
+        from (
+            select count(*) as c
+            from __splink__df_concat
+            group by {source_dataset_column_name}
+        ) as counts_by_dataset
+        """
+    else:
+        sql = """
+        select count(*) * (count(*) - 1) / 2 as cartesian
+        from __splink__df_concat
+        """
+    pipeline.enqueue_sql(sql, "__splink__cartesian_count")
+
+    # Left join from the one-row cartesian count so we still get the
+    # cartesian value back even if no comparisons are generated.  No ORDER BY
+    # is needed: the rows are aligned by match_key in Python
     sql = """
-        select
-        count(*) as row_count,
-        match_key
-        from __splink__blocked_id_pairs
-        group by match_key
-        order by cast(match_key as int) asc
+        select b.match_key, b.row_count, c.cartesian
+        from __splink__cartesian_count as c
+        left join (
+            select count(*) as row_count, match_key
+            from __splink__blocked_id_pairs
+            group by match_key
+        ) as b
+        on 1=1
     """
     pipeline.enqueue_sql(sql, "__splink__df_count_cumulative_blocks")
 
-    result_df = db_api.sql_pipeline_to_splink_dataframe(pipeline).as_pandas_dataframe()
-
-    # The above table won't include rules that have no matches
-    all_rules_df = pd.DataFrame(
-        {
-            "match_key": [str(i) for i in range(len(blocking_rules))],
-            "blocking_rule": [br.blocking_rule_sql for br in blocking_rules],
-        }
-    )
-    if len(result_df) > 0:
-        complete_df = all_rules_df.merge(result_df, on="match_key", how="left").fillna(
-            {"row_count": 0}
-        )
+    # The result is at most one row per blocking rule, so fetch it as records
+    # rather than paying for a pandas DataFrame conversion
+    result_records = db_api.sql_pipeline_to_splink_dataframe(pipeline).as_record_dict()
 
-        complete_df["cumulative_rows"] = complete_df["row_count"].cumsum().astype(int)
-        complete_df["start"] = complete_df["cumulative_rows"] - complete_df["row_count"]
-        complete_df["cartesian"] = cartesian_count
+    cartesian_count = result_records[0]["cartesian"]
 
-        for c in ["row_count", "cumulative_rows", "cartesian", "start"]:
-            complete_df[c] = complete_df[c].astype(int)
+    # The result won't include rules that have no matches, so scatter the
+    # counts by match_key into an array covering the full list of blocking
+    # rules, leaving zero counts for any missing rules
+    row_counts = np.zeros(len(blocking_rules), dtype=np.int64)
+    for record in result_records:
+        if record["match_key"] is not None:
+            row_counts[int(record["match_key"])] = record["row_count"]
 
-    else:
-        complete_df = all_rules_df.copy()
-        complete_df["row_count"] = 0
-        complete_df["cumulative_rows"] = 0
-        complete_df["cartesian"] = cartesian_count
-        complete_df["start"] = 0
+    cumulative_rows = row_counts.cumsum()
 
     [b.drop_materialised_id_pairs_dataframe() for b in exploding_br_with_id_tables]
 
-    col_order = [
-        "blocking_rule",
-        "row_count",
-        "cumulative_rows",
-        "cartesian",
-        "match_key",
-        "start",
-    ]
-
-    return complete_df[col_order]
+    return pd.DataFrame(
+        {
+            "blocking_rule": [br.blocking_rule_sql for br in blocking_rules],
+            "row_count": row_counts,
+            "cumulative_rows": cumulative_rows,
+            "cartesian": int(cartesian_count),
+            "match_key": [str(i) for i in range(len(blocking_rules))],
+            "start": cumulative_rows - row_counts,
+        },
+        copy=False,
+    )
 
 
 def _count_comparisons_generated_from_blocking_rule(
@@ -447,19 +491,16 @@ def _count_comparisons_generated_from_blocking_rule(
     )
     pipeline.enqueue_list_of_sqls(sqls)
 
-    sql = """
-    select cast(sum(block_count) as bigint) as count_of_pairwise_comparisons_generated
-    from __splink__block_counts
-    """
-
-    pipeline.enqueue_sql(sql=sql, output_table_name="__splink__total_of_block_counts")
-
     pre_filter_total_df = db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
     pre_filter_total = pre_filter_total_df.as_record_dict()[0][
         "count_of_pairwise_comparisons_generated"
     ]
-    pre_filter_total_df.drop_table_from_database_and_remove_from_cache()
+    # Deliberately leave the one-row result table in the database.  The db_api
+    # caches executed pipelines keyed on a hash of their SQL (which embeds the
+    # blocking rule and the physical input table names), so repeat counts for
+    # the same rule against the same inputs become a cache lookup rather than
+    # a fresh scan
 
     def add_l_r(sql, table_name):
         tree = sqlglot.parse_one(sql, dialect=db_api.sql_dialect.sqlglot_name)
@@ -509,7 +550,6 @@ def _count_comparisons_generated_from_blocking_rule(
         post_filter_total = post_filter_total_df.as_record_dict()[0][
             "count_of_pairwise_comparisons_generated"
         ]
-        post_filter_total_df.drop_table_from_database_and_remove_from_cache()
     else:
         post_filter_total = "exceeded max_rows_limit, see warning"
 
@@ -719,20 +759,43 @@ def n_largest_blocks(
 
     splink_df_dict = db_api.register_multiple_tables(table_or_tables)
 
-    sqls = _count_comparisons_from_blocking_rule_pre_filter_conditions_sqls(
-        splink_df_dict, blocking_rule_as_br, link_type, db_api
+    join_conditions = blocking_rule_as_br._equi_join_conditions
+    two_dataset_link_only = link_type == "link_only" and len(splink_df_dict) == 2
+
+    input_tablename_l, input_tablename_r, sqls = _input_tablenames_and_concat_sqls(
+        splink_df_dict, two_dataset_link_only
     )
+
+    (
+        l_cols_sel_str,
+        r_cols_sel_str,
+        l_cols_gb_str,
+        r_cols_gb_str,
+        using_str,
+    ) = _join_key_select_expressions(join_conditions)
+
     pipeline = CTEPipeline()
     pipeline.enqueue_list_of_sqls(sqls)
 
-    join_conditions = blocking_rule_as_br._equi_join_conditions
+    sql = f"""
+    select {l_cols_sel_str}, count(*) as count_l
+    from {input_tablename_l}
+    group by {l_cols_gb_str}
+    """
+    pipeline.enqueue_sql(sql, "__splink__count_comparisons_from_blocking_l")
+
+    sql = f"""
+    select {r_cols_sel_str}, count(*) as count_r
+    from {input_tablename_r}
+    group by {r_cols_gb_str}
+    """
+    pipeline.enqueue_sql(sql, "__splink__count_comparisons_from_blocking_r")
 
-    keys = ", ".join(f"key_{i}" for i in range(len(join_conditions)))
     sql = f"""
-    select {keys}, count_l, count_r,  count_l * count_r as block_count
+    select {using_str}, count_l, count_r,  count_l * count_r as block_count
     from __splink__count_comparisons_from_blocking_l
     inner join __splink__count_comparisons_from_blocking_r
-    using ({keys})
+    using ({using_str})
     order by count_l * count_r desc
     limit {n_largest}
     """
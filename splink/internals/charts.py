@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import math
 import os
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, Union
 
 import numpy as np
@@ -25,9 +26,16 @@ if TYPE_CHECKING:
 ChartReturnType = Union[Dict[Any, Any], alt.core.SchemaBase]
 
 
-def load_chart_definition(filename):
+@lru_cache(maxsize=None)
+def _chart_definition_text(filename: str) -> str:
     path = f"internals/files/chart_defs/{filename}"
-    return json.loads(read_resource(path))
+    return read_resource(path)
+
+
+def load_chart_definition(filename):
+    # cache the raw spec text so repeat renders don't re-read package data,
+    # but parse per call so each caller gets a fresh dict to mutate
+    return json.loads(_chart_definition_text(filename))
 
 
 def _load_external_libs():
@@ -172,9 +180,7 @@ def match_weights_interactive_history_chart(records, as_dict=False, blocking_rul
     records = [r for r in records if r["comparison_vector_value"] != -1]
     chart["data"]["values"] = records
 
-    max_iteration = 0
-    for r in records:
-        max_iteration = max(r["iteration"], max_iteration)
+    max_iteration = max((r["iteration"] for r in records), default=0)
 
     chart["params"][0]["bind"]["max"] = max_iteration
     chart["params"][0]["value"] = max_iteration
@@ -192,9 +198,7 @@ def m_u_parameters_interactive_history_chart(records, as_dict=False):
     ]
     chart["data"]["values"] = records
 
-    max_iteration = 0
-    for r in records:
-        max_iteration = max(r["iteration"], max_iteration)
+    max_iteration = max((r["iteration"] for r in records), default=0)
 
     chart["params"][0]["bind"]["max"] = max_iteration
     chart["params"][0]["value"] = max_iteration
@@ -228,7 +232,7 @@ def roc_chart(records, width=400, height=400, as_dict=False):
     # If 'curve_label' not in records, remove colour coding
     # This is for if you want to compare roc curves
     r = records[0]
-    if "curve_label" not in r.keys():
+    if "curve_label" not in r:
         del chart["encoding"]["color"]
 
     chart["height"] = height
@@ -246,7 +250,7 @@ def precision_recall_chart(records, width=400, height=400, as_dict=False):
     # If 'curve_label' not in records, remove colour coding
     # This is for if you want to compare roc curves
     r = records[0]
-    if "curve_label" not in r.keys():
+    if "curve_label" not in r:
         del chart["encoding"]["color"]
 
     chart["height"] = height
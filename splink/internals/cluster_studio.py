@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import os
 import random
 from typing import TYPE_CHECKING, Any, Literal, Optional
@@ -8,7 +7,7 @@ from typing import TYPE_CHECKING, Any, Literal, Optional
 from jinja2 import Template
 
 from splink.internals.exceptions import SplinkException
-from splink.internals.misc import EverythingEncoder, read_resource
+from splink.internals.misc import compact_json_dumps, read_resource
 from splink.internals.pipeline import CTEPipeline
 from splink.internals.splink_dataframe import SplinkDataFrame
 from splink.internals.unique_id_concat import (
@@ -380,21 +379,19 @@ def render_splink_cluster_studio_html(
     template = Template(read_resource(template_path))
 
     template_data: dict[str, Any] = {
-        "raw_edge_data": json.dumps(edges_recs, cls=EverythingEncoder),
-        "raw_node_data": json.dumps(nodes_recs, cls=EverythingEncoder),
-        "raw_clusters_data": json.dumps(cluster_recs, cls=EverythingEncoder),
-        "splink_settings": json.dumps(
-            linker._settings_obj._as_completed_dict(), cls=EverythingEncoder
+        "raw_edge_data": compact_json_dumps(edges_recs),
+        "raw_node_data": compact_json_dumps(nodes_recs),
+        "raw_clusters_data": compact_json_dumps(cluster_recs),
+        "splink_settings": compact_json_dumps(
+            linker._settings_obj._as_completed_dict()
         ),
-        "svu_options": json.dumps(svu_options, cls=EverythingEncoder),
+        "svu_options": compact_json_dumps(svu_options),
     }
 
     if cluster_names:
         named_clusters_dict = dict(zip(cluster_ids, cluster_names))
 
-        template_data["named_clusters"] = json.dumps(
-            named_clusters_dict, cls=EverythingEncoder
-        )
+        template_data["named_clusters"] = compact_json_dumps(named_clusters_dict)
 
     files = {
         "embed": "internals/files/external_js/vega-embed@6.20.2",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from copy import copy
 from typing import TYPE_CHECKING, Any, List, Optional
 
 from splink.internals.misc import (
@@ -103,6 +104,11 @@ class Comparison:
                 level.comparison_vector_value
             ]
 
+    def copy(self) -> "Comparison":
+        cc = copy(self)
+        cc.comparison_levels = [cl.copy() for cl in self.comparison_levels]
+        return cc
+
     @property
     def _num_levels(self):
         return len([cl for cl in self.comparison_levels if not cl.is_null_level])
@@ -368,16 +374,15 @@ class Comparison:
 
     @property
     def _as_detailed_records(self) -> list[dict[str, Any]]:
-        records = []
-        for cl in self.comparison_levels:
-            record = {}
-            record["comparison_name"] = self.output_column_name
-            record = {
-                **record,
-                **cl._as_detailed_record(self._num_levels, self.comparison_levels),
+        num_levels = self._num_levels
+        comparison_levels = self.comparison_levels
+        return [
+            {
+                "comparison_name": self.output_column_name,
+                **cl._as_detailed_record(num_levels, comparison_levels),
             }
-            records.append(record)
-        return records
+            for cl in comparison_levels
+        ]
 
     @property
     def _parameter_estimates_as_records(self):
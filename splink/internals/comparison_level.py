@@ -178,7 +178,12 @@ class ComparisonLevel:
 
     def copy(self):
         # define a simple copy method to make copying easy/customisable
-        return copy(self)
+        cl = copy(self)
+        # trained probabilities are appended to in place, so the copy needs
+        # its own lists
+        cl._trained_m_probabilities = list(self._trained_m_probabilities)
+        cl._trained_u_probabilities = list(self._trained_u_probabilities)
+        return cl
 
     @property
     def sql_dialect(self):
@@ -385,17 +390,19 @@ class ComparisonLevel:
             "then comparison is"
         )
 
-        if self._bayes_factor == math.inf:
+        # _bayes_factor re-derives its value on each access, so take it once
+        bayes_factor = self._bayes_factor
+        if bayes_factor == math.inf:
             return f"{text} certain to be a match"
-        elif self._bayes_factor == 0.0:
+        elif bayes_factor == 0.0:
             return f"{text} impossible to be a match"
-        elif self._bayes_factor >= 1.0:
+        elif bayes_factor >= 1.0:
             return (
-                f"{text} {self._num_fmt_dp_or_sf(self._bayes_factor)} times "
+                f"{text} {self._num_fmt_dp_or_sf(bayes_factor)} times "
                 "more likely to be a match"
             )
         else:
-            mult = 1 / self._bayes_factor
+            mult = 1 / bayes_factor
             return (
                 f"{text} {self._num_fmt_dp_or_sf(mult)} times "
                 "less likely to be a match"
@@ -686,6 +693,10 @@ class ComparisonLevel:
         self, comparison_num_levels: int, comparison_levels: list[ComparisonLevel]
     ) -> dict[str, Any]:
         "A detailed representation of this level to describe it in charting outputs"
+        # the descriptions appear twice in the record, so compute them once
+        m_probability_description = self._m_probability_description
+        u_probability_description = self._u_probability_description
+
         output: dict[str, Any] = {}
         output["sql_condition"] = self.sql_condition
         output["label_for_charts"] = self._label_for_charts_no_duplicates(
@@ -696,8 +707,8 @@ class ComparisonLevel:
             output["m_probability"] = self.m_probability
             output["u_probability"] = self.u_probability
 
-            output["m_probability_description"] = self._m_probability_description
-            output["u_probability_description"] = self._u_probability_description
+            output["m_probability_description"] = m_probability_description
+            output["u_probability_description"] = u_probability_description
 
         output["has_tf_adjustments"] = self._has_tf_adjustments
         if self._has_tf_adjustments:
@@ -712,8 +723,8 @@ class ComparisonLevel:
         output["comparison_vector_value"] = self.comparison_vector_value
         output["max_comparison_vector_value"] = comparison_num_levels - 1
         output["bayes_factor_description"] = self._bayes_factor_description
-        output["m_probability_description"] = self._m_probability_description
-        output["u_probability_description"] = self._u_probability_description
+        output["m_probability_description"] = m_probability_description
+        output["u_probability_description"] = u_probability_description
 
         return output
 
@@ -57,8 +57,14 @@ class DatabaseAPI(ABC, Generic[TablishType]):
         Any errors will be converted to SplinkException with more detail
         names are only relevant for logging, not execution
         """
-        logger.debug(execute_sql_logging_message_info(templated_name, physical_name))
-        logger.log(5, log_sql(final_sql))
+        # guard the formatting - this runs for every query executed, and
+        # log_sql interpolates the full SQL string
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                execute_sql_logging_message_info(templated_name, physical_name)
+            )
+        if logger.isEnabledFor(5):
+            logger.log(5, log_sql(final_sql))
         try:
             return self._execute_sql_against_backend(final_sql)
         except Exception as e:
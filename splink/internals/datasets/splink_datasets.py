@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import io
+import os
+import shutil
 from pathlib import Path
 from urllib.request import urlopen
 
@@ -17,6 +19,19 @@ def datafile_exists(file_loc):
     return file_loc.is_file()
 
 
+def _read_parquet(data_source):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        # pandas will use whichever parquet engine is available
+        return pd.read_parquet(data_source)
+    # use_threads parallelises the column decode across cores, and
+    # self_destruct frees each arrow buffer as it is converted, so we avoid
+    # briefly holding two copies of the dataset during conversion
+    table = pq.read_table(data_source, use_threads=True)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
 def dataset_property(metadata_method):
     ds_meta = metadata_method(None)
     dataset_name = ds_meta.dataset_name
@@ -31,23 +46,34 @@ def dataset_property(metadata_method):
         data_source: Path | io.BytesIO
         if not datafile_exists(file_loc):
             print(f"downloading: {url}")  # noqa: T201
-            data = urlopen(url)
-            print("")  # noqa: T201
-
-            data_source = io.BytesIO(data.read())
             try:
+                # Stream the download in chunks to a temporary file, then move
+                # it into place atomically.  This avoids holding the whole
+                # dataset in memory, and an interrupted download can never
+                # leave a partial file at file_loc for datafile_exists to
+                # accept on the next run
                 datasets_cache_dir.mkdir(exist_ok=True)
-                with open(file_loc, "wb+") as write_file:
-                    write_file.write(data_source.getvalue())
+                tmp_loc = file_loc.with_suffix(file_loc.suffix + ".part")
+                with urlopen(url) as response, open(tmp_loc, "wb") as write_file:
+                    # preallocate when the server reports a size, so the file
+                    # is laid out contiguously for subsequent reads
+                    size = int(response.headers.get("Content-Length", 0))
+                    if size:
+                        write_file.truncate(size)
+                    shutil.copyfileobj(response, write_file, length=1024 * 1024)
+                os.replace(tmp_loc, file_loc)
+                data_source = file_loc
             except PermissionError:
-                pass
-            data_source.seek(0)
+                # the cache dir is not writeable, so read into memory instead
+                with urlopen(url) as response:
+                    data_source = io.BytesIO(response.read())
+            print("")  # noqa: T201
         else:
             data_source = file_loc
 
         read_function = {
             "csv": pd.read_csv,
-            "parquet": pd.read_parquet,
+            "parquet": _read_parquet,
         }.get(data_format, None)
 
         # just in case we have an invalid format
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, List
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Optional
 
 from splink.internals.blocking import BlockingRule, block_using_rules_sqls
 from splink.internals.charts import (
@@ -95,14 +96,15 @@ class EMTrainingSession:
 
         # Remove comparison columns which are either 'used up' by the blocking rules
         comparisons_to_deactivate = []
-        br_cols = get_columns_used_from_sql(
-            blocking_rule_for_training.blocking_rule_sql,
-            self.db_api.sql_dialect.sqlglot_name,
+        br_cols = set(
+            get_columns_used_from_sql(
+                blocking_rule_for_training.blocking_rule_sql,
+                self.db_api.sql_dialect.sqlglot_name,
+            )
         )
         for cc in core_model_settings.comparisons:
-            cc_cols = cc._input_columns_used_by_case_statement
-            cc_cols = [c.input_name for c in cc_cols]
-            if set(br_cols).intersection(cc_cols):
+            cc_cols = {c.input_name for c in cc._input_columns_used_by_case_statement}
+            if not br_cols.isdisjoint(cc_cols):
                 comparisons_to_deactivate.append(cc)
         cc_names_to_deactivate = [
             cc.output_column_name for cc in comparisons_to_deactivate
@@ -132,11 +134,23 @@ class EMTrainingSession:
                 needs_matchkey_column=False,
             )
         )
+        # snapshot the blocking column selection too - it is a pure function
+        # of settings state fixed at this point, and the underlying property
+        # rebuilds the list on every access
+        self.columns_to_select_for_blocking: List[str] = (
+            linker._settings_obj._columns_to_select_for_blocking
+        )
 
         self.core_model_settings = core_model_settings
         # initial params get inserted in training
         self._core_model_settings_history: List[CoreModelSettings] = []
 
+        # blocking + comparison vector computation is expensive, so cache
+        # the result for the lifetime of the session.  The vectors depend only
+        # on state fixed at construction (blocking rule, column selection), so
+        # the cache never needs invalidating
+        self._comparison_vectors_cache: Optional[SplinkDataFrame] = None
+
     def _training_log_message(self):
         not_estimated = [
             cc.output_column_name for cc in self._comparisons_that_cannot_be_estimated
@@ -169,6 +183,9 @@ class EMTrainingSession:
         )
 
     def _comparison_vectors(self) -> SplinkDataFrame:
+        if self._comparison_vectors_cache is not None:
+            return self._comparison_vectors_cache
+
         self._training_log_message()
 
         pipeline = CTEPipeline()
@@ -191,7 +208,7 @@ class EMTrainingSession:
         pipeline = CTEPipeline([blocked_pairs, nodes_with_tf])
 
         sqls = compute_comparison_vector_values_from_id_pairs_sqls(
-            orig_settings._columns_to_select_for_blocking,
+            self.columns_to_select_for_blocking,
             self.columns_to_select_for_comparison_vector_values,
             input_tablename_l="__splink__df_concat_with_tf",
             input_tablename_r="__splink__df_concat_with_tf",
@@ -200,7 +217,10 @@ class EMTrainingSession:
         )
 
         pipeline.enqueue_list_of_sqls(sqls)
-        return self.db_api.sql_pipeline_to_splink_dataframe(pipeline)
+        self._comparison_vectors_cache = self.db_api.sql_pipeline_to_splink_dataframe(
+            pipeline
+        )
+        return self._comparison_vectors_cache
 
     def _train(self, cvv: SplinkDataFrame = None) -> CoreModelSettings:
         if cvv is None:
@@ -237,6 +257,7 @@ class EMTrainingSession:
         )
         self.core_model_settings = core_model_settings_history[-1]
         self._core_model_settings_history = core_model_settings_history
+        self._invalidate_history_record_caches()
 
         rule = self._blocking_rule_for_training.blocking_rule_sql
         training_desc = f"EM, blocked on: {rule}"
@@ -249,10 +270,12 @@ class EMTrainingSession:
             orig_cc = original_core_model_settings.get_comparison_by_output_column_name(
                 cc.output_column_name
             )
+            orig_cl_by_comparison_vector_value = {
+                ocl.comparison_vector_value: ocl
+                for ocl in orig_cc._comparison_levels_excluding_null
+            }
             for cl in cc._comparison_levels_excluding_null:
-                orig_cl = orig_cc._get_comparison_level_by_comparison_vector_value(
-                    cl.comparison_vector_value
-                )
+                orig_cl = orig_cl_by_comparison_vector_value[cl.comparison_vector_value]
 
                 if "m" not in self.training_fixed_probabilities:
                     not_observed = LEVEL_NOT_OBSERVED_TEXT
@@ -285,7 +308,7 @@ class EMTrainingSession:
                         )
         return original_core_model_settings
 
-    @property
+    @cached_property
     def _blocking_adjusted_probability_two_random_records_match(self):
         orig_prop_m = (
             self.original_core_model_settings.probability_two_random_records_match
@@ -293,7 +316,12 @@ class EMTrainingSession:
 
         adj_bayes_factor = prob_to_bayes_factor(orig_prop_m)
 
-        logger.log(15, f"Original prob two random records match: {orig_prop_m:.3f}")
+        # guard so that f-string formatting is skipped unless verbose
+        # logging is switched on
+        log_verbose = logger.isEnabledFor(15)
+
+        if log_verbose:
+            logger.log(15, f"Original prob two random records match: {orig_prop_m:.3f}")
 
         comp_level_infos = self._comparison_levels_to_reverse_blocking_rule
 
@@ -302,26 +330,33 @@ class EMTrainingSession:
             comparison = comp_level_info["comparison"]
             adj_bayes_factor = cl._bayes_factor * adj_bayes_factor
 
+            if log_verbose:
+                logger.log(
+                    15,
+                    f"Increasing prob two random records match using "
+                    f"{comparison.output_column_name} - {cl.label_for_charts}"
+                    f" using bayes factor {cl._bayes_factor:,.3f}",
+                )
+
+        adjusted_prop_m = bayes_factor_to_prob(adj_bayes_factor)
+        if log_verbose:
             logger.log(
                 15,
-                f"Increasing prob two random records match using "
-                f"{comparison.output_column_name} - {cl.label_for_charts}"
-                f" using bayes factor {cl._bayes_factor:,.3f}",
+                f"\nProb two random records match adjusted for blocking on "
+                f"{self._blocking_rule_for_training.blocking_rule_sql}: "
+                f"{adjusted_prop_m:.3f}",
             )
-
-        adjusted_prop_m = bayes_factor_to_prob(adj_bayes_factor)
-        logger.log(
-            15,
-            f"\nProb two random records match adjusted for blocking on "
-            f"{self._blocking_rule_for_training.blocking_rule_sql}: "
-            f"{adjusted_prop_m:.3f}",
-        )
         return adjusted_prop_m
 
-    @property
+    @cached_property
     def _iteration_history_records(self):
         output_records = []
 
+        # TODO: why lambda from current settings, not history?
+        final_prob_two_random_records_match = (
+            self.core_model_settings.probability_two_random_records_match
+        )
+
         for iteration, core_model_settings in enumerate(
             self._core_model_settings_history
         ):
@@ -329,27 +364,32 @@ class EMTrainingSession:
 
             for r in records:
                 r["iteration"] = iteration
-                # TODO: why lambda from current settings, not history?
                 r["probability_two_random_records_match"] = (
-                    self.core_model_settings.probability_two_random_records_match
+                    final_prob_two_random_records_match
                 )
 
             output_records.extend(records)
         return output_records
 
-    @property
+    @cached_property
     def _lambda_history_records(self):
-        output_records = []
-        for i, s in enumerate(self._core_model_settings_history):
-            lam = s.probability_two_random_records_match
-            r = {
+        return [
+            {
                 "probability_two_random_records_match": lam,
                 "probability_two_random_records_match_reciprocal": 1 / lam,
                 "iteration": i,
             }
+            for i, lam in enumerate(
+                s.probability_two_random_records_match
+                for s in self._core_model_settings_history
+            )
+        ]
 
-            output_records.append(r)
-        return output_records
+    def _invalidate_history_record_caches(self):
+        # cached_property stores on the instance, so discard any stale
+        # entries when the underlying history changes
+        self.__dict__.pop("_iteration_history_records", None)
+        self.__dict__.pop("_lambda_history_records", None)
 
     def probability_two_random_records_match_iteration_chart(self) -> ChartReturnType:
         """
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import logging
 import multiprocessing
-from copy import deepcopy
 from typing import TYPE_CHECKING, List
 
 from splink.internals.blocking import block_using_rules_sqls, blocking_rule_to_obj
@@ -15,13 +14,14 @@ from splink.internals.m_u_records_to_parameters import (
 )
 from splink.internals.pipeline import CTEPipeline
 from splink.internals.vertically_concatenate import (
+    compute_df_concat,
     enqueue_df_concat,
     split_df_concat_with_tf_into_two_tables_sqls,
 )
 
 from .expectation_maximisation import (
     compute_new_parameters_sql,
-    compute_proportions_for_new_parameters,
+    compute_proportions_for_new_parameters_sql,
 )
 
 # https://stackoverflow.com/questions/39740632/python-type-hinting-without-cyclic-imports
@@ -68,7 +68,9 @@ def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> Non
 
     original_settings_obj = linker._settings_obj
 
-    training_linker: Linker = deepcopy(linker)
+    # A structural copy is sufficient here: only the retain flags, the
+    # comparison levels' tf adjustments and the blocking rules are mutated
+    training_linker: Linker = linker._clone_for_training()
 
     settings_obj = training_linker._settings_obj
     settings_obj._retain_matching_columns = False
@@ -90,8 +92,11 @@ def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> Non
         pipeline.enqueue_sql(sql, "__splink__df_concat_count")
         count_dataframe = db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
+        # Deliberately leave the one-row count table in place.  The row count
+        # of the concatenated input is invariant within a session, and the
+        # db_api caches pipelines on a hash of their SQL, so repeat calls
+        # (e.g. re-running u training) skip the count scan entirely
         result = count_dataframe.as_record_dict()
-        count_dataframe.drop_table_from_database_and_remove_from_cache()
         total_nodes = result[0]["count"]
         sample_size = _rows_needed_for_n_pairs(max_pairs)
         proportion = sample_size / total_nodes
@@ -104,8 +109,8 @@ def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> Non
         """
         pipeline.enqueue_sql(sql, "__splink__df_concat_count")
         counts_dataframe = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+        # As above, leave the table in place so repeat calls are cache hits
         result = counts_dataframe.as_record_dict()
-        counts_dataframe.drop_table_from_database_and_remove_from_cache()
         frame_counts = [res["count"] for res in result]
 
         proportion, sample_size = _proportion_sample_size_link_only(
@@ -121,16 +126,25 @@ def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> Non
         sample_size = total_nodes
 
     pipeline = CTEPipeline()
-    pipeline = enqueue_df_concat(training_linker, pipeline)
 
-    sql = f"""
-    select *
-    from __splink__df_concat
-    {training_linker._random_sample_sql(proportion, sample_size, seed)}
-    """
+    if proportion == 1.0:
+        # The sample is the whole input, so materialising
+        # __splink__df_concat_sample would just be a verbatim copy of
+        # __splink__df_concat.  Use the concatenated input directly instead
+        df_sample = compute_df_concat(training_linker, pipeline)
+        sample_tablename = "__splink__df_concat"
+    else:
+        pipeline = enqueue_df_concat(training_linker, pipeline)
 
-    pipeline.enqueue_sql(sql, "__splink__df_concat_sample")
-    df_sample = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+        sql = f"""
+        select *
+        from __splink__df_concat
+        {training_linker._random_sample_sql(proportion, sample_size, seed)}
+        """
+
+        pipeline.enqueue_sql(sql, "__splink__df_concat_sample")
+        df_sample = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+        sample_tablename = "__splink__df_concat_sample"
 
     pipeline = CTEPipeline(input_dataframes=[df_sample])
 
@@ -145,8 +159,8 @@ def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> Non
     else:
         settings_obj._blocking_rules_to_generate_predictions = []
 
-    input_tablename_sample_l = "__splink__df_concat_sample"
-    input_tablename_sample_r = "__splink__df_concat_sample"
+    input_tablename_sample_l = sample_tablename
+    input_tablename_sample_r = sample_tablename
 
     if (
         len(linker._input_tables_dict) == 2
@@ -155,10 +169,10 @@ def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> Non
         sqls = split_df_concat_with_tf_into_two_tables_sqls(
             "__splink__df_concat",
             linker._settings_obj.column_info_settings.source_dataset_column_name,
-            sample_switch=True,
+            sample_switch=proportion != 1.0,
         )
-        input_tablename_sample_l = "__splink__df_concat_sample_left"
-        input_tablename_sample_r = "__splink__df_concat_sample_right"
+        input_tablename_sample_l = f"{sample_tablename}_left"
+        input_tablename_sample_r = f"{sample_tablename}_right"
 
         pipeline.enqueue_list_of_sqls(sqls)
 
@@ -178,8 +192,8 @@ def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> Non
     sqls = compute_comparison_vector_values_from_id_pairs_sqls(
         settings_obj._columns_to_select_for_blocking,
         settings_obj._columns_to_select_for_comparison_vector_values,
-        input_tablename_l="__splink__df_concat_sample",
-        input_tablename_r="__splink__df_concat_sample",
+        input_tablename_l=sample_tablename,
+        input_tablename_r=sample_tablename,
         source_dataset_input_column=settings_obj.column_info_settings.source_dataset_input_column,
         unique_id_input_column=settings_obj.column_info_settings.unique_id_input_column,
     )
@@ -199,18 +213,34 @@ def estimate_u_values(linker: Linker, max_pairs: float, seed: int = None) -> Non
     )
 
     pipeline.enqueue_sql(sql, "__splink__m_u_counts")
+
+    # Normalise the counts into proportions within the same pipeline, rather
+    # than pulling the counts into pandas and normalising locally
+    sql = compute_proportions_for_new_parameters_sql("__splink__m_u_counts")
+
+    pipeline.enqueue_sql(sql, "__splink__m_u_proportions")
+
+    # u estimation has no use for the probability_two_random_records_match
+    # row, so filter it out in the pipeline rather than in Python afterwards
+    sql = """
+    select *
+    from __splink__m_u_proportions
+    where output_column_name != '_probability_two_random_records_match'
+    """
+
+    pipeline.enqueue_sql(sql, "__splink__m_u_records")
     df_params = db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
-    param_records = df_params.as_pandas_dataframe()
-    param_records = compute_proportions_for_new_parameters(param_records)
+    m_u_records = df_params.as_record_dict()
     df_params.drop_table_from_database_and_remove_from_cache()
-    df_sample.drop_table_from_database_and_remove_from_cache()
-
-    m_u_records = [
-        r
-        for r in param_records
-        if r["output_column_name"] != "_probability_two_random_records_match"
-    ]
+    # the blocked pairs were consumed by the pipeline above, so release the
+    # table as soon as the parameters exist rather than leaving it until the
+    # session is cleaned up
+    blocked_pairs.drop_table_from_database_and_remove_from_cache()
+    if proportion != 1.0:
+        # when no sample was taken, df_sample is the cached concatenated
+        # input, which other routines may still need
+        df_sample.drop_table_from_database_and_remove_from_cache()
 
     m_u_records_lookup = m_u_records_to_lookup_dict(m_u_records)
 
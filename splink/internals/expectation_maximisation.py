@@ -325,7 +325,10 @@ def expectation_maximisation(
         max_change_dict = _max_change_in_parameters_comparison_levels(
             core_model_settings_history
         )
-        logger.info(f"Iteration {i}: {max_change_dict['message']}")
+        # building the message walks the change dict, so only do so if it
+        # will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Iteration {i}: {_max_change_message(max_change_dict)}")
         end_time = time.time()
         logger.log(15, f"    Iteration time: {end_time - start_time} seconds")
 
@@ -373,16 +376,14 @@ def _max_change_in_parameters_comparison_levels(
         "max_change_type": None,
         "max_change_value": None,
     }
-    comparisons = zip(previous_iteration.comparisons, this_iteration.comparisons)
-    for comparison in comparisons:
-        prev_cc = comparison[0]
-        this_cc = comparison[1]
-        z_cls = zip(prev_cc.comparison_levels, this_cc.comparison_levels)
-        for z_cl in z_cls:
-            if z_cl[0].is_null_level:
+    for prev_cc, this_cc in zip(
+        previous_iteration.comparisons, this_iteration.comparisons
+    ):
+        for prev_cl, this_cl in zip(
+            prev_cc.comparison_levels, this_cc.comparison_levels
+        ):
+            if prev_cl.is_null_level:
                 continue
-            prev_cl = z_cl[0]
-            this_cl = z_cl[1]
 
             prev_m_prob = cast(float, prev_cl.m_probability)
             this_m_prob = cast(float, this_cl.m_probability)
@@ -390,19 +391,24 @@ def _max_change_in_parameters_comparison_levels(
             this_u_prob = cast(float, this_cl.u_probability)
             change_m = this_m_prob - prev_m_prob
             change_u = this_u_prob - prev_u_prob
-
-            change = max(abs(change_m), abs(change_u))
-            change_type = (
-                "m_probability" if abs(change_m) > abs(change_u) else "u_probability"
-            )
-            change_value = change_m if abs(change_m) > abs(change_u) else change_u
+            abs_change_m = abs(change_m)
+            abs_change_u = abs(change_u)
+
+            if abs_change_m > abs_change_u:
+                change = abs_change_m
+                change_type = "m_probability"
+                change_value = change_m
+            else:
+                change = abs_change_u
+                change_type = "u_probability"
+                change_value = change_u
             if change > max_change:
                 max_change = change
                 max_change_levels["prev_comparison_level"] = prev_cl
                 max_change_levels["current_comparison_level"] = this_cl
                 max_change_levels["max_change_type"] = change_type
                 max_change_levels["max_change_value"] = change_value
-                max_change_levels["max_abs_change_value"] = abs(change_value)
+                max_change_levels["max_abs_change_value"] = change
                 max_change_levels["output_column_name"] = this_cc.output_column_name
 
     change_probability_two_random_records_match = (
@@ -422,6 +428,4 @@ def _max_change_in_parameters_comparison_levels(
             change_probability_two_random_records_match
         )
 
-    max_change_levels["message"] = _max_change_message(max_change_levels)
-
     return max_change_levels
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 from typing import TYPE_CHECKING, Any
@@ -9,7 +8,7 @@ import numpy as np
 import pandas as pd
 from jinja2 import Template
 
-from splink.internals.misc import EverythingEncoder, read_resource
+from splink.internals.misc import compact_json_dumps, read_resource
 from splink.internals.pipeline import CTEPipeline
 from splink.internals.splink_dataframe import SplinkDataFrame
 from splink.internals.vertically_concatenate import compute_df_concat_with_tf
@@ -95,8 +94,8 @@ def render_labelling_tool_html(
         "slt": read_resource("internals/files/labelling_tool/slt.js"),
         "d3": read_resource("internals/files/external_js/d3@7.8.5"),
         "stdlib": read_resource("internals/files/external_js/stdlib.js@5.8.3"),
-        "pairwise_comparison_data": json.dumps(comparisons_recs, cls=EverythingEncoder),
-        "splink_settings_data": json.dumps(settings, cls=EverythingEncoder),
+        "pairwise_comparison_data": compact_json_dumps(comparisons_recs),
+        "splink_settings_data": compact_json_dumps(settings),
         "view_in_jupyter": view_in_jupyter,
         "show_splink_predictions_in_interface": show_splink_predictions_in_interface,
     }
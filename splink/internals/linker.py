@@ -40,6 +40,7 @@ from splink.internals.pipeline import CTEPipeline
 from splink.internals.predict import (
     predict_from_comparison_vectors_sqls,
 )
+from splink.internals.settings import Settings
 from splink.internals.settings_creator import SettingsCreator
 from splink.internals.settings_validation.log_invalid_columns import (
     InvalidColumnsLogger,
@@ -358,15 +359,13 @@ class Linker:
         """
         return self._db_api.table_to_splink_dataframe(templated_name, physical_name)
 
-    def __deepcopy__(self, memo):
-        """When we do EM training, we need a copy of the linker which is independent
-        of the main linker e.g. setting parameters on the copy will not affect the
-        main linker.  This method implements ensures linker can be deepcopied.
+    def _clone_with_settings(self, new_settings: Settings) -> "Linker":
+        """Shallow clone of the linker with the supplied settings object.
+        The database connection and table caches are shared with this linker
         """
         new_linker = copy(self)
         new_linker._em_training_sessions = []
 
-        new_settings = deepcopy(self._settings_obj)
         new_linker._settings_obj = new_settings
 
         new_linker.clustering = LinkerClustering(new_linker)
@@ -379,6 +378,21 @@ class Linker:
 
         return new_linker
 
+    def _clone_for_training(self) -> "Linker":
+        """A copy of the linker whose settings can be mutated without affecting
+        the main linker.  The comparison tree is copied structurally (see
+        Settings.copy) rather than recursively deep-copied, which is much
+        cheaper for models with many comparison levels
+        """
+        return self._clone_with_settings(self._settings_obj.copy())
+
+    def __deepcopy__(self, memo):
+        """When we do EM training, we need a copy of the linker which is independent
+        of the main linker e.g. setting parameters on the copy will not affect the
+        main linker.  This method implements ensures linker can be deepcopied.
+        """
+        return self._clone_with_settings(deepcopy(self._settings_obj))
+
     def _predict_warning(self):
         if not self._settings_obj._is_fully_trained:
             msg = (
@@ -413,6 +427,11 @@ class Linker:
     def _populate_probability_two_random_records_match_from_trained_values(self):
         recip_prop_matches_estimates = []
 
+        # the running estimates in this loop are only computed for the log
+        # messages, so skip the conversions altogether when verbose logging
+        # is off
+        log_verbose = logger.isEnabledFor(15)
+
         logger.log(
             15,
             (
@@ -427,13 +446,15 @@ class Linker:
                 em_training_session._comparison_levels_to_reverse_blocking_rule
             )
 
-            logger.log(
-                15,
-                "\n"
-                f"Probability two random records match from trained model blocking on "
-                f"{em_training_session._blocking_rule_for_training.blocking_rule_sql}: "
-                f"{training_lambda:,.3f}",
-            )
+            if log_verbose:
+                logger.log(
+                    15,
+                    "\n"
+                    f"Probability two random records match from trained model "
+                    f"blocking on "
+                    f"{em_training_session._blocking_rule_for_training.blocking_rule_sql}: "  # noqa: E501
+                    f"{training_lambda:,.3f}",
+                )
 
             for reverse_level_info in reverse_level_infos:
                 # Get comparison level on current settings obj
@@ -453,24 +474,25 @@ class Linker:
                 else:
                     bf = cl._bayes_factor
 
-                logger.log(
-                    15,
-                    f"Reversing comparison level {cc.output_column_name}"
-                    f" using bayes factor {bf:,.3f}",
-                )
-
                 training_lambda_bf = training_lambda_bf / bf
 
-                as_prob = bayes_factor_to_prob(training_lambda_bf)
-
-                logger.log(
-                    15,
-                    (
-                        "This estimate of probability two random records match now: "
-                        f" {as_prob:,.3f} "
-                        f"with reciprocal {(1/as_prob):,.3f}"
-                    ),
-                )
+                if log_verbose:
+                    logger.log(
+                        15,
+                        f"Reversing comparison level {cc.output_column_name}"
+                        f" using bayes factor {bf:,.3f}",
+                    )
+
+                    as_prob = bayes_factor_to_prob(training_lambda_bf)
+
+                    logger.log(
+                        15,
+                        (
+                            "This estimate of probability two random records match "
+                            f"now:  {as_prob:,.3f} "
+                            f"with reciprocal {(1/as_prob):,.3f}"
+                        ),
+                    )
             logger.log(15, "\n---------")
             p = bayes_factor_to_prob(training_lambda_bf)
             recip_prop_matches_estimates.append(1 / p)
@@ -1,5 +1,5 @@
 import logging
-from copy import deepcopy
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from splink.internals.blocking import BlockingRule, block_using_rules_sqls
@@ -23,63 +23,92 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def estimate_m_values_from_label_column(linker: "Linker", label_colname: str) -> None:
-    msg = f" Estimating m probabilities using from column {label_colname} "
-    logger.info(f"{msg:-^70}")
+@contextmanager
+def _temporarily_disable_tf_and_retention(settings_obj):
+    """Temporarily turn off column retention and tf adjustments on a settings
+    object, restoring the original values on exit.
+
+    Avoids the need to deepcopy the whole linker (settings, caches, db
+    handles) when training code only needs these fields toggled for the
+    duration of a pipeline build.
+    """
+    retain_matching = settings_obj._retain_matching_columns
+    retain_intermediate = settings_obj._retain_intermediate_calculation_columns
+    tf_adjustment_columns = [
+        cl._tf_adjustment_column
+        for cc in settings_obj.comparisons
+        for cl in cc.comparison_levels
+    ]
 
-    original_settings_object = linker._settings_obj
-    training_linker = deepcopy(linker)
-    settings_obj = training_linker._settings_obj
     settings_obj._retain_matching_columns = False
     settings_obj._retain_intermediate_calculation_columns = False
     for cc in settings_obj.comparisons:
         for cl in cc.comparison_levels:
             # TODO: ComparisonLevel: manage access
             cl._tf_adjustment_column = None
+    try:
+        yield settings_obj
+    finally:
+        settings_obj._retain_matching_columns = retain_matching
+        settings_obj._retain_intermediate_calculation_columns = retain_intermediate
+        levels = (cl for cc in settings_obj.comparisons for cl in cc.comparison_levels)
+        for cl, tf_col in zip(levels, tf_adjustment_columns):
+            cl._tf_adjustment_column = tf_col
 
-    pipeline = CTEPipeline()
-    nodes_with_tf = compute_df_concat_with_tf(linker, pipeline)
-
-    pipeline = CTEPipeline([nodes_with_tf])
-
-    sqls = block_using_rules_sqls(
-        input_tablename_l="__splink__df_concat_with_tf",
-        input_tablename_r="__splink__df_concat_with_tf",
-        blocking_rules=[BlockingRule(f"l.{label_colname} = r.{label_colname}")],
-        link_type=settings_obj._link_type,
-        source_dataset_input_column=settings_obj.column_info_settings.source_dataset_input_column,
-        unique_id_input_column=settings_obj.column_info_settings.unique_id_input_column,
-    )
-    pipeline.enqueue_list_of_sqls(sqls)
 
-    blocked_pairs = training_linker._db_api.sql_pipeline_to_splink_dataframe(pipeline)
-
-    pipeline = CTEPipeline([blocked_pairs, nodes_with_tf])
-
-    sqls = compute_comparison_vector_values_from_id_pairs_sqls(
-        training_linker._settings_obj._columns_to_select_for_blocking,
-        training_linker._settings_obj._columns_to_select_for_comparison_vector_values,
-        input_tablename_l="__splink__df_concat_with_tf",
-        input_tablename_r="__splink__df_concat_with_tf",
-        source_dataset_input_column=training_linker._settings_obj.column_info_settings.source_dataset_input_column,
-        unique_id_input_column=training_linker._settings_obj.column_info_settings.unique_id_input_column,
-    )
-
-    pipeline.enqueue_list_of_sqls(sqls)
+def estimate_m_values_from_label_column(linker: "Linker", label_colname: str) -> None:
+    msg = f" Estimating m probabilities using from column {label_colname} "
+    logger.info(f"{msg:-^70}")
 
-    sql = """
-    select *, cast(1.0 as float8) as match_probability
-    from __splink__df_comparison_vectors
-    """
-    pipeline.enqueue_sql(sql, "__splink__df_predict")
+    original_settings_object = linker._settings_obj
+    settings_obj = original_settings_object
 
-    sql = compute_new_parameters_sql(
-        estimate_without_term_frequencies=False,
-        comparisons=settings_obj.comparisons,
-    )
-    pipeline.enqueue_sql(sql, "__splink__m_u_counts")
+    # Compute the concat with tf table before toggling retention/tf settings
+    # so the cached table is built (and cached) with the original settings
+    pipeline = CTEPipeline()
+    nodes_with_tf = compute_df_concat_with_tf(linker, pipeline)
 
-    df_params = training_linker._db_api.sql_pipeline_to_splink_dataframe(pipeline)
+    with _temporarily_disable_tf_and_retention(settings_obj):
+        pipeline = CTEPipeline([nodes_with_tf])
+
+        sqls = block_using_rules_sqls(
+            input_tablename_l="__splink__df_concat_with_tf",
+            input_tablename_r="__splink__df_concat_with_tf",
+            blocking_rules=[BlockingRule(f"l.{label_colname} = r.{label_colname}")],
+            link_type=settings_obj._link_type,
+            source_dataset_input_column=settings_obj.column_info_settings.source_dataset_input_column,
+            unique_id_input_column=settings_obj.column_info_settings.unique_id_input_column,
+        )
+        pipeline.enqueue_list_of_sqls(sqls)
+
+        blocked_pairs = linker._db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+        pipeline = CTEPipeline([blocked_pairs, nodes_with_tf])
+
+        sqls = compute_comparison_vector_values_from_id_pairs_sqls(
+            settings_obj._columns_to_select_for_blocking,
+            settings_obj._columns_to_select_for_comparison_vector_values,
+            input_tablename_l="__splink__df_concat_with_tf",
+            input_tablename_r="__splink__df_concat_with_tf",
+            source_dataset_input_column=settings_obj.column_info_settings.source_dataset_input_column,
+            unique_id_input_column=settings_obj.column_info_settings.unique_id_input_column,
+        )
+
+        pipeline.enqueue_list_of_sqls(sqls)
+
+        sql = """
+        select *, cast(1.0 as float8) as match_probability
+        from __splink__df_comparison_vectors
+        """
+        pipeline.enqueue_sql(sql, "__splink__df_predict")
+
+        sql = compute_new_parameters_sql(
+            estimate_without_term_frequencies=False,
+            comparisons=settings_obj.comparisons,
+        )
+        pipeline.enqueue_sql(sql, "__splink__m_u_counts")
+
+        df_params = linker._db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
     param_records = df_params.as_pandas_dataframe()
     param_records = compute_proportions_for_new_parameters(param_records)
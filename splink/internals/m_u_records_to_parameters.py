@@ -16,19 +16,18 @@ def m_u_records_to_lookup_dict(
     for m_u_record in m_u_records:
         comparison_name = m_u_record["output_column_name"]
         level_value = m_u_record["comparison_vector_value"]
-        if comparison_name not in lookup:
-            lookup[comparison_name] = {}
-        if level_value not in lookup[comparison_name]:
-            lookup[comparison_name][level_value] = {}
+        level_lookup = lookup.setdefault(comparison_name, {}).setdefault(
+            level_value, {}
+        )
 
         m_prob = m_u_record["m_probability"]
 
         u_prob = m_u_record["u_probability"]
 
         if m_prob is not None:
-            lookup[comparison_name][level_value]["m_probability"] = m_prob
+            level_lookup["m_probability"] = m_prob
         if u_prob is not None:
-            lookup[comparison_name][level_value]["u_probability"] = u_prob
+            level_lookup["u_probability"] = u_prob
 
     return lookup
 
@@ -5,7 +5,7 @@ import string
 from collections import namedtuple
 from datetime import datetime, timedelta
 from math import ceil, inf, log2
-from typing import Iterable
+from typing import Any, Iterable
 
 import numpy as np
 
@@ -96,6 +96,15 @@ class EverythingEncoder(json.JSONEncoder):
             return obj.__str__()
 
 
+def compact_json_dumps(obj: Any) -> str:
+    """Serialise data for embedding in a .html file.
+
+    Uses compact separators because the output is hardcoded into javascript,
+    where indentation and whitespace just bloat the file
+    """
+    return json.dumps(obj, cls=EverythingEncoder, separators=(",", ":"))
+
+
 def calculate_cartesian(df_rows, link_type):
     """
     Calculates the cartesian product for the input df(s).
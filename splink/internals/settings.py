@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from copy import deepcopy
+from copy import copy
 from dataclasses import asdict, dataclass
 from typing import Any, List, Literal, Sequence, TypedDict
 
@@ -113,20 +113,24 @@ class CoreModelSettings:
     comparisons: List[Comparison]
     probability_two_random_records_match: float
 
-    def copy(self):
-        """Returns a deepcopy of CoreModelSettings"""
-        return deepcopy(self)
+    def copy(self) -> "CoreModelSettings":
+        """Returns a copy of CoreModelSettings
+
+        Comparison levels are copied so that their trained parameters can be
+        mutated independently.  Everything else hanging off a comparison
+        (column info settings, dialect info) is never mutated in place, so is
+        shared by reference rather than deep-copied
+        """
+        return CoreModelSettings(
+            comparisons=[cc.copy() for cc in self.comparisons],
+            probability_two_random_records_match=(
+                self.probability_two_random_records_match
+            ),
+        )
 
     @property
     def parameters_as_detailed_records(self):
-        output = []
         rr_match = self.probability_two_random_records_match
-        for i, cc in enumerate(self.comparisons):
-            records = cc._as_detailed_records
-            for r in records:
-                r["probability_two_random_records_match"] = rr_match
-                r["comparison_sort_order"] = i
-            output.extend(records)
 
         prior_description = (
             "The probability that two random records drawn at random match is "
@@ -136,7 +140,8 @@ class CoreModelSettings:
             f"{prob_to_match_weight(rr_match):.3f}."
         )
 
-        # Finally add a record for probability_two_random_records_match
+        # The record for probability_two_random_records_match goes first, so
+        # start the output with it rather than insert(0, ...)-ing it at the end
         prop_record = {
             "comparison_name": "probability_two_random_records_match",
             "sql_condition": None,
@@ -157,7 +162,14 @@ class CoreModelSettings:
             "probability_two_random_records_match": rr_match,
             "comparison_sort_order": -1,
         }
-        output.insert(0, prop_record)
+
+        output = [prop_record]
+        for i, cc in enumerate(self.comparisons):
+            records = cc._as_detailed_records
+            for r in records:
+                r["probability_two_random_records_match"] = rr_match
+                r["comparison_sort_order"] = i
+            output.extend(records)
         return output
 
     def get_comparison_by_output_column_name(self, name: str) -> Comparison:
@@ -269,6 +281,22 @@ class Settings:
                     "you're doing, you can ignore this warning"
                 )
 
+    def copy(self) -> "Settings":
+        """Returns a copy of the settings
+
+        The comparison tree and the blocking rule list are copied so that
+        trained parameters, tf adjustments and blocking rules can be mutated
+        independently.  Sub-objects that are never mutated in place
+        (column info settings, training settings) are shared by reference,
+        making this much cheaper than a deepcopy for wide models
+        """
+        new_settings = copy(self)
+        new_settings.core_model_settings = self.core_model_settings.copy()
+        new_settings._blocking_rules_to_generate_predictions = list(
+            self._blocking_rules_to_generate_predictions
+        )
+        return new_settings
+
     # TODO: unpick these four
     @property
     def comparisons(self) -> List[Comparison]:
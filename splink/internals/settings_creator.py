@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from copy import deepcopy
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any, List, Literal, Union
 
@@ -51,8 +51,19 @@ class SettingsCreator:
         Naive in the sense that we do not process the attributes in any way.
 
         In particular blocking rules and comparisons could be dicts _or_ creator objects
+
+        We deliberately avoid dataclasses.asdict, which recursively deepcopies
+        every attribute value.  Callers immediately replace the comparisons and
+        blocking rules entries with processed versions, so those copies are
+        wasted work - a shallow copy of any list attributes is sufficient
         """
-        return asdict(self)
+        naive_dict = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, list):
+                value = list(value)
+            naive_dict[f.name] = value
+        return naive_dict
 
     def _as_creator_dict(self) -> dict[str, Any]:
         """
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import json
 import os
 from typing import TYPE_CHECKING, Any
 
 from jinja2 import Template
 
-from splink.internals.misc import EverythingEncoder, read_resource
+from splink.internals.misc import compact_json_dumps, read_resource
 
 from .predict import _combine_prior_and_bfs
 
@@ -125,10 +124,8 @@ def render_splink_comparison_viewer_html(
     template = Template(read_resource(template_path))
 
     template_data: dict[str, Any] = {
-        "comparison_vector_data": json.dumps(
-            comparison_vector_data, cls=EverythingEncoder
-        ),
-        "splink_settings": json.dumps(splink_settings),
+        "comparison_vector_data": compact_json_dumps(comparison_vector_data),
+        "splink_settings": compact_json_dumps(splink_settings),
     }
 
     files = {
@@ -229,9 +229,10 @@ def tf_adjustment_chart(
         "log2_bayes_factor",
     ]
 
-    # Select levels with TF adjustments
+    # Select levels with TF adjustments.  Iterate the (short) list of keys to
+    # retain and test membership against the record dict, not vice versa
     comparison_records = [
-        {k: cl[k] for k in cl.keys() if k in keys_to_retain}
+        {k: cl[k] for k in keys_to_retain if k in cl}
         for cl in comparison_records
         if cl["has_tf_adjustments"]
     ]
@@ -126,8 +126,10 @@ def test_dedupe_only():
     all_log_messages = "\n".join(log_list)
     all_log_messages = re.sub(r"\s+", " ", all_log_messages)
 
+    # max_pairs exceeds the total number of possible pairs, so no sample table
+    # is created and the join is against __splink__df_concat directly
     assert (
-        "from __splink__df_concat_sample as l inner join __splink__df_concat_sample as r"  # noqa: E501
+        "from __splink__df_concat as l inner join __splink__df_concat as r"
         in all_log_messages
     )
 